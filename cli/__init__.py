@@ -1,42 +1,51 @@
 import argparse
+import sys
+from functools import partial
+from typing import Union
 from pathlib import Path
 
-from cli.utils import CustomHelpFormatter, _validate_track_index
-from deezy.audio_encoders.dee.dd import DDEncoderDEE
-from deezy.audio_encoders.dee.ddp import DDPEncoderDEE
-from deezy.enums import case_insensitive_enum, enum_choices
-from deezy.enums.dd import DolbyDigitalChannels
-from deezy.enums.ddp import DolbyDigitalPlusChannels
-from deezy.enums.shared import ProgressMode, StereoDownmix, DeeDRC
-from deezy.info import AudioStreamViewer
-from deezy.payloads.dd import DDPayload
-from deezy.payloads.ddp import DDPPayload
+from cli.utils import CustomHelpFormatter, _sniff_subcommand, _validate_track_index
 from deezy.utils.dependencies import DependencyNotFoundError, FindDependencies
 from deezy.utils.exit import _exit_application, exit_fail, exit_success
 from deezy.utils.file_parser import FileParser
 from deezy.utils._version import program_name, __version__
 
-
-def cli_parser(base_wd: Path):
-    # Top-level parser
-    parser = argparse.ArgumentParser(prog=program_name)
-
-    # Add a global -v flag
-    parser.add_argument(
-        "-v", "--version", action="version", version=f"%(prog)s {__version__}"
-    )
-
-    # Sub-command parser
-    subparsers = parser.add_subparsers(dest="sub_command")
-
-    #############################################################
-    ### Common args (re-used across one or more sub commands) ###
-    #############################################################
-    # Input files argument group
-    input_group = argparse.ArgumentParser(add_help=False)
-    input_group.add_argument(
-        "input", nargs="+", help="Input file paths or directories", metavar="INPUT"
-    )
+# shared help formatter for the encode format parsers
+_HELP_FORMATTER = partial(CustomHelpFormatter, width=78, max_help_position=3)
+
+# every top-level sub command, even when only some of their parsers are built
+_SUB_COMMANDS = ("encode", "find", "info")
+
+# payload field -> parsed argument name (shared by every encode format)
+_PAYLOAD_ARGS = {
+    "track_index": "track_index",
+    "bitrate": "bitrate",
+    "delay": "delay",
+    "temp_dir": "temp_dir",
+    "keep_temp": "keep_temp",
+    "file_output": "output",
+    "progress_mode": "progress_mode",
+    "stereo_mix": "stereo_down_mix",
+    "channels": "channels",
+    "drc": "dynamic_range_compression",
+}
+
+
+def _create_encode_parsers(
+    subparsers, input_group: argparse.ArgumentParser, only: Union[str, None] = None
+):
+    """Adds the encode command and it's format sub commands.
+
+    Args:
+        subparsers: Top-level sub command parsers
+        input_group (argparse.ArgumentParser): Shared input files argument group
+        only (str, None): Format sub command to build, None builds all of them
+    """
+    # enums are only needed for the encode arguments, find/info never load them
+    from deezy.enums import case_insensitive_enum, enum_choices
+    from deezy.enums.dd import DolbyDigitalChannels
+    from deezy.enums.ddp import DolbyDigitalPlusChannels
+    from deezy.enums.shared import ProgressMode, StereoDownmix, DeeDRC
 
     #############################################################
     ###################### Encode Command #######################
@@ -81,13 +90,12 @@ def cli_parser(base_wd: Path):
         action="store_true",
         help="Keeps the temp files after finishing (usually a wav and an xml for DEE).",
     )
-    # TODO add a SILENT mode (already in enums)
     encode_group.add_argument(
         "-p",
         "--progress-mode",
         type=case_insensitive_enum(ProgressMode),
         default=ProgressMode.STANDARD,
-        choices=list(ProgressMode),
+        choices=ProgressMode,
         metavar=enum_choices(ProgressMode),
         help="Sets progress output mode verbosity.",
     )
@@ -110,77 +118,76 @@ def cli_parser(base_wd: Path):
         "-s",
         "--stereo-down-mix",
         type=case_insensitive_enum(StereoDownmix),
-        choices=list(StereoDownmix),
+        choices=StereoDownmix,
         default=StereoDownmix.STANDARD,
         metavar=enum_choices(StereoDownmix),
         help="Down mix method for stereo.",
     )
 
-    ### Dolby Digital Command ###
-    encode_dd_parser = encode_subparsers.add_parser(
-        "dd",
-        parents=[input_group, encode_group, downmix_group],
-        formatter_class=lambda prog: CustomHelpFormatter(
-            prog,
-            width=78,
-            max_help_position=3,
-        ),
-    )
-    encode_dd_parser.add_argument(
-        "-c",
-        "--channels",
-        type=case_insensitive_enum(DolbyDigitalChannels),
-        choices=list(DolbyDigitalChannels),
-        default=DolbyDigitalChannels.AUTO,
-        metavar=enum_choices(DolbyDigitalChannels),
-        help="The number of channels.",
-    )
-    # TODO this will likely only be valid for DEE, so we'll need to
-    # decide what we want to do here
-    encode_dd_parser.add_argument(
-        "-drc",
-        "--dynamic-range-compression",
+    # shared dynamic range compression argument (same for every DEE format)
+    drc_kwargs = dict(
         type=case_insensitive_enum(DeeDRC),
-        choices=list(DeeDRC),
+        choices=DeeDRC,
         metavar=enum_choices(DeeDRC),
         default=DeeDRC.MUSIC_LIGHT,
         help="Dynamic range compression settings.",
     )
 
-    ### Dolby Digital Plus Command ###
-    encode_ddp_parser = encode_subparsers.add_parser(
-        "ddp",
-        parents=[input_group, encode_group, downmix_group],
-        formatter_class=lambda prog: CustomHelpFormatter(
-            prog,
-            width=78,
-            max_help_position=3,
-        ),
-    )
-    encode_ddp_parser.add_argument(
-        "-c",
-        "--channels",
-        type=case_insensitive_enum(DolbyDigitalPlusChannels),
-        choices=list(DolbyDigitalPlusChannels),
-        default=DolbyDigitalPlusChannels.AUTO,
-        metavar=enum_choices(DolbyDigitalPlusChannels),
-        help="The number of channels.",
-    )
-    encode_ddp_parser.add_argument(
-        "-n", "--normalize", action="store_true", help="Normalize audio for DDP."
-    )
-    # TODO this will likely only be valid for DEE, so we'll need to
-    # decide what we want to do here
-    encode_ddp_parser.add_argument(
-        "-drc",
-        "--dynamic-range-compression",
-        type=case_insensitive_enum(DeeDRC),
-        choices=list(DeeDRC),
-        metavar=enum_choices(DeeDRC),
-        default=DeeDRC.MUSIC_LIGHT,
-        help="Dynamic range compression settings.",
-    )
+    ### Dolby Digital Command ###
+    if only in (None, "dd"):
+        encode_dd_parser = encode_subparsers.add_parser(
+            "dd",
+            parents=[input_group, encode_group, downmix_group],
+            formatter_class=_HELP_FORMATTER,
+        )
+        encode_dd_parser.add_argument(
+            "-c",
+            "--channels",
+            type=case_insensitive_enum(DolbyDigitalChannels),
+            choices=DolbyDigitalChannels,
+            default=DolbyDigitalChannels.AUTO,
+            metavar=enum_choices(DolbyDigitalChannels),
+            help="The number of channels.",
+        )
+        # TODO this will likely only be valid for DEE, so we'll need to
+        # decide what we want to do here
+        encode_dd_parser.add_argument(
+            "-drc", "--dynamic-range-compression", **drc_kwargs
+        )
 
+    ### Dolby Digital Plus Command ###
+    if only in (None, "ddp"):
+        encode_ddp_parser = encode_subparsers.add_parser(
+            "ddp",
+            parents=[input_group, encode_group, downmix_group],
+            formatter_class=_HELP_FORMATTER,
+        )
+        encode_ddp_parser.add_argument(
+            "-c",
+            "--channels",
+            type=case_insensitive_enum(DolbyDigitalPlusChannels),
+            choices=DolbyDigitalPlusChannels,
+            default=DolbyDigitalPlusChannels.AUTO,
+            metavar=enum_choices(DolbyDigitalPlusChannels),
+            help="The number of channels.",
+        )
+        encode_ddp_parser.add_argument(
+            "-n", "--normalize", action="store_true", help="Normalize audio for DDP."
+        )
+        # TODO this will likely only be valid for DEE, so we'll need to
+        # decide what we want to do here
+        encode_ddp_parser.add_argument(
+            "-drc", "--dynamic-range-compression", **drc_kwargs
+        )
+
+
+def _create_other_parsers(subparsers, input_group: argparse.ArgumentParser):
+    """Adds the find and info commands.
+
+    Args:
+        subparsers: Top-level sub command parsers
+        input_group (argparse.ArgumentParser): Shared input files argument group
+    """
     #############################################################
     ## Find Command (placeholder, expect this would essentially just run
     ## the globs and print the filepaths it finds)
@@ -202,22 +209,72 @@ def cli_parser(base_wd: Path):
     info_parser = subparsers.add_parser("info", parents=[input_group])
     # TODO: Add arg options if required
 
+
+def cli_parser(base_wd: Path):
+    # answer a bare version request before building any parsers
+    if sys.argv[1:] in (["-v"], ["--version"]):
+        _exit_application(f"{program_name} {__version__}", exit_success)
+
+    # work out which sub command was requested so we only build what's needed,
+    # anything unknown builds every parser so argparse can report it
+    sub_command, format_command = _sniff_subcommand(sys.argv[1:])
+    if sub_command not in _SUB_COMMANDS:
+        sub_command = format_command = None
+    if format_command not in {"dd", "ddp"}:
+        format_command = None
+
+    # Top-level parser
+    parser = argparse.ArgumentParser(prog=program_name)
+
+    # Add a global -v flag
+    parser.add_argument(
+        "-v", "--version", action="version", version=f"%(prog)s {__version__}"
+    )
+
+    # Sub-command parser, when only some commands are built a fixed metavar keeps the
+    # usage line listing every command (unknown commands build all of them and keep
+    # argparse's own wording)
+    subparsers = parser.add_subparsers(
+        dest="sub_command",
+        metavar="{" + ",".join(_SUB_COMMANDS) + "}" if sub_command else None,
+    )
+
+    #############################################################
+    ### Common args (re-used across one or more sub commands) ###
+    #############################################################
+    # Input files argument group
+    input_group = argparse.ArgumentParser(add_help=False)
+    input_group.add_argument(
+        "input", nargs="+", help="Input file paths or directories", metavar="INPUT"
+    )
+
+    # only build the encode parsers when they can be used
+    if sub_command in (None, "encode"):
+        _create_encode_parsers(subparsers, input_group, only=format_command)
+
+    # find/info parsers are never consulted on encode runs
+    if sub_command in (None, "find", "info"):
+        _create_other_parsers(subparsers, input_group)
+
     #############################################################
     ######################### Execute ###########################
     #############################################################
     # parse the arguments
     args = parser.parse_args()
 
+    # live view of the parsed args, sub command specific args may not exist
+    arg_values = vars(args)
+
     if not args.sub_command:
         if not hasattr(args, "version"):
             parser.print_usage()
         _exit_application("", exit_fail)
 
-    # detect tool dependencies
-    ffmpeg_arg = args.ffmpeg if hasattr(args, "ffmpeg") else None
-    dee_arg = args.dee if hasattr(args, "dee") else None
+    # detect tool dependencies (--ffmpeg/--dee only exist on encode parsers)
     try:
-        tools = FindDependencies().get_dependencies(base_wd, ffmpeg_arg, dee_arg)
+        tools = FindDependencies().get_dependencies(
+            base_wd, arg_values.get("ffmpeg"), arg_values.get("dee")
+        )
     except DependencyNotFoundError as e:
         _exit_application(e, exit_fail)
     ffmpeg_path = Path(tools.ffmpeg)
@@ -227,18 +284,15 @@ def cli_parser(base_wd: Path):
         _exit_application("", exit_fail)
 
     if args.sub_command not in {"find", "info"}:
-        if (
-            not hasattr(args, "channels")
-            or not args.channels
-            or int(args.channels.value) == 0
-        ):
+        channels = arg_values.get("channels")
+        if not channels or int(channels.value) == 0:
             print(
                 "No channel(s) specified, will automatically detect highest quality supported channel based on codec."
             )
 
-        if not hasattr(args, "bitrate") or not args.bitrate:
+        if not arg_values.get("bitrate"):
             print("No bitrate specified, defaulting to 448k.")
-            setattr(args, "bitrate", 448)
+            args.bitrate = 448
 
     # parse all possible file inputs
     # TODO We will need to decide what to do when multiple file inputs
@@ -255,76 +309,51 @@ def cli_parser(base_wd: Path):
         # print message
         # print(f"Processing input: {Path(args.input).name}")
 
-        # encode Dolby Digital
-        if args.format_command == "dd":
-            # TODO We will need to catch all expected expectations possible and wrap this in a try except
-            # with the exit application output. That way we're not catching all generic issues.
-            # _exit_application(e, exit_fail)
-            # TODO we need to catch all errors that we know will happen here in the scope
-
-            # update payload
-            # TODO prevent duplicate payload code somehow
-            try:
-                for input_file in file_inputs:
-                    payload = DDPayload()
-                    payload.file_input = input_file
-                    payload.track_index = args.track_index
-                    payload.bitrate = args.bitrate
-                    payload.delay = args.delay
-                    payload.temp_dir = args.temp_dir
-                    payload.keep_temp = args.keep_temp
-                    payload.file_output = args.output
-                    payload.progress_mode = args.progress_mode
-                    payload.stereo_mix = args.stereo_down_mix
-                    payload.channels = args.channels
-                    payload.drc = args.dynamic_range_compression
-
-                    # TODO Not sure if this is how we wanna inject, but for now...
-                    payload.ffmpeg_path = ffmpeg_path
-                    payload.dee_path = dee_path
-
-                    # encoder
-                    dd = DDEncoderDEE().encode(payload)
-                    print(f"Job successful! Output file path:\n{dd}")
-            except Exception as e:
-                # TODO not sure if we wanna exit or continue for batch?
-                _exit_application(e, exit_fail)
-
-        # Encode Dolby Digital Plus
-        elif args.format_command == "ddp":
-            # TODO We will need to catch all expected expectations possible and wrap this in a try except
-            # with the exit application output. That way we're not catching all generic issues.
-            # _exit_application(e, exit_fail)
-            # TODO we need to catch all errors that we know will happen here in the scope
-
-            # update payload
-            # TODO prevent duplicate payload code somehow
-            try:
-                for input_file in file_inputs:
-                    payload = DDPPayload()
-                    payload.file_input = input_file
-                    payload.track_index = args.track_index
-                    payload.bitrate = args.bitrate
-                    payload.delay = args.delay
-                    payload.temp_dir = args.temp_dir
-                    payload.keep_temp = args.keep_temp
-                    payload.file_output = args.output
-                    payload.progress_mode = args.progress_mode
-                    payload.stereo_mix = args.stereo_down_mix
-                    payload.channels = args.channels
-                    payload.normalize = args.normalize
-                    payload.drc = args.dynamic_range_compression
-
-                    # TODO Not sure if this is how we wanna inject, but for now...
-                    payload.ffmpeg_path = ffmpeg_path
-                    payload.dee_path = dee_path
-
-                    # encoder
-                    ddp = DDPEncoderDEE().encode(payload)
-                    print(f"Output file path:\n{ddp}")
-            except Exception as e:
-                # TODO not sure if we wanna exit or continue for batch?
-                _exit_application(e, exit_fail)
+        # encoder modules pull in pymediainfo/xmltodict, only import them when encoding
+        # (payloads are only ever built here too)
+        from deezy.payloads.dd import DDPayload
+        from deezy.payloads.ddp import DDPPayload
+        from deezy.audio_encoders.dee.dd import DDEncoderDEE
+        from deezy.audio_encoders.dee.ddp import DDPEncoderDEE
+
+        # payload and encoder for each format command
+        payload_type, encoder_type = {
+            "dd": (DDPayload, DDEncoderDEE),
+            "ddp": (DDPPayload, DDPEncoderDEE),
+        }[args.format_command]
+
+        # TODO We will need to catch all expected expectations possible and wrap this in a try except
+        # with the exit application output. That way we're not catching all generic issues.
+        # _exit_application(e, exit_fail)
+        # TODO we need to catch all errors that we know will happen here in the scope
+
+        # payload values are the same for every input, read them from the parsed args once
+        payload_values = {
+            field: arg_values[arg] for field, arg in _PAYLOAD_ARGS.items()
+        }
+
+        # format specific args
+        if args.format_command == "ddp":
+            payload_values["normalize"] = arg_values["normalize"]
+
+        # TODO Not sure if this is how we wanna inject, but for now...
+        payload_values["ffmpeg_path"] = ffmpeg_path
+        payload_values["dee_path"] = dee_path
+
+        # update payload
+        try:
+            for input_file in file_inputs:
+                payload = payload_type()
+                for field, value in payload_values.items():
+                    setattr(payload, field, value)
+                payload.file_input = input_file
+
+                # encoder
+                output = encoder_type().encode(payload)
+                print(f"Job successful! Output file path:\n{output}")
+        except Exception as e:
+            # TODO not sure if we wanna exit or continue for batch?
+            _exit_application(e, exit_fail)
 
     elif args.sub_command == "find":
         # TODO ensure this is done the best way possible.
@@ -337,22 +366,26 @@ def cli_parser(base_wd: Path):
             # append file to file_names (ensuring they are strings for the .join method)
             file_names.append(str(input_file))
 
-            # Join the file names with newlines
-            found_files = "\n".join(file_names)
+        # Join the file names with newlines
+        found_files = "\n".join(file_names)
 
         _exit_application(found_files, exit_success)
 
     elif args.sub_command == "info":
+        # pymediainfo is only needed here, don't import it for other commands
+        from deezy.info import AudioStreamViewer
+
         # TODO this probably needs handled in a cleaner way.
         # could use list comprehension here but will be harder to
         # add args if we add them later?
-        track_s_info = ""
+        # collect each file's block and emit them with a single join at the end
+        stream_viewer = AudioStreamViewer()
+        track_s_info = []
         for input_file in file_inputs:
-            info = AudioStreamViewer().parse_audio_streams(input_file)
-            track_s_info = (
-                track_s_info
-                + f"File: {input_file.name}\nAudio tracks: {info.track_list}\n"
+            info = stream_viewer.parse_audio_streams(input_file)
+            track_s_info.append(
+                f"File: {input_file.name}\nAudio tracks: {info.track_list}\n"
                 + info.media_info
                 + "\n\n"
             )
-        _exit_application(track_s_info, exit_success)
+        _exit_application("".join(track_s_info), exit_success)
@@ -46,3 +46,18 @@ def _validate_track_index(value: any):
         return int(value)
     # If the input is invalid, return the default value
     return 0
+
+
+def _sniff_subcommand(argv: list):
+    """
+    Finds the requested sub command and the command nested under it (format command)
+    without parsing, so only the needed parsers have to be built.
+
+    Args:
+        argv (list): Command line arguments without the program name
+
+    Returns:
+        tuple: Sub command and nested command, either can be None
+    """
+    positionals = (arg for arg in argv if not arg.startswith("-"))
+    return next(positionals, None), next(positionals, None)
@@ -27,9 +27,10 @@ class BaseAudioEncoder:
         Returns:
             bool: True or False
         """
+        # a missing file raises, so reaching the return already means it exists
         if not input_file.exists():
             raise InputFileNotFoundError(f"Could not find {input_file.name}.")
-        return input_file.exists()
+        return True
 
     @staticmethod
     def _check_disk_space(
@@ -81,7 +81,6 @@ class BaseDeeAudioEncoder(BaseAudioEncoder, ABC):
             "-rf64",
             "always",
             "-hide_banner",
-            "-v",
             "-stats",
             str(Path(output_dir / wav_file_name)),
         ]
@@ -105,7 +104,6 @@ class BaseDeeAudioEncoder(BaseAudioEncoder, ABC):
             "500",
             "--diagnostics-interval",
             "90000",
-            "--verbose",
             "-x",
             str(xml_path),
             "--disable-xml-validation",
@@ -160,8 +158,8 @@ class BaseDeeAudioEncoder(BaseAudioEncoder, ABC):
                 raise PathTooLongError(
                     "Path provided with input file exceeds path length for DEE."
                 )
-            temp_directory = Path(temp_dir)
-            temp_directory.mkdir(exist_ok=True)
+            # mkdtemp has already created the directory
+            temp_directory = temp_dir
 
         else:
             temp_directory = Path(tempfile.mkdtemp(prefix=TEMP_PREFIX))
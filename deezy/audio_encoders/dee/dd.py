@@ -1,5 +1,4 @@
 import shutil
-import tempfile
 from typing import Union, List
 from pathlib import Path
 
@@ -84,8 +83,9 @@ class DDEncoderDEE(BaseDeeAudioEncoder):
             recommended_free_space=audio_track_info.recommended_free_space,
         )
 
-        # temp filename
-        temp_filename = Path(tempfile.NamedTemporaryFile(delete=False).name).name
+        # temp filename (the temp dir is already unique to this job, re-use its name
+        # rather than creating and leaking an empty file in the OS temp dir)
+        temp_filename = temp_dir.name
 
         # check to see if input channels are accepted by dee
         dee_allowed_input = self._dee_allowed_input(audio_track_info.channels)
@@ -279,12 +279,7 @@ class DDEncoderDEE(BaseDeeAudioEncoder):
                     str(sample_rate),
                 ]
             elif not resample:
-                audio_filter_args = [
-                    "-ac",
-                    "2",
-                    "-af",
-                    "aresample=matrix_encoding=dplii",
-                ]
+                audio_filter_args = ["-af", "aresample=matrix_encoding=dplii"]
         elif resample:
             audio_filter_args = [
                 "-af",
@@ -293,8 +288,9 @@ class DDEncoderDEE(BaseDeeAudioEncoder):
                 str(sample_rate),
             ]
 
-        # utilize ffmpeg to downmix for channels that aren't supported by DEE
-        if ffmpeg_down_mix or stereo_down_mix == StereoDownmix.DPLII:
+        # utilize ffmpeg to downmix for channels that aren't supported by DEE (or for DPLII),
+        # this is the only place the channel count is added to the command
+        if ffmpeg_down_mix:
             audio_filter_args.extend(["-ac", f"{ffmpeg_down_mix}"])
 
         # base ffmpeg command
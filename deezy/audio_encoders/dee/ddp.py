@@ -1,5 +1,4 @@
 import shutil
-import tempfile
 from typing import Union, List
 from pathlib import Path
 
@@ -83,8 +82,9 @@ class DDPEncoderDEE(BaseDeeAudioEncoder):
             recommended_free_space=audio_track_info.recommended_free_space,
         )
 
-        # temp filename
-        temp_filename = Path(tempfile.NamedTemporaryFile(delete=False).name).name
+        # temp filename (the temp dir is already unique to this job, re-use its name
+        # rather than creating and leaking an empty file in the OS temp dir)
+        temp_filename = temp_dir.name
 
         # check to see if input channels are accepted by dee
         dee_allowed_input = self._dee_allowed_input(audio_track_info.channels)
@@ -9,6 +9,26 @@ from deezy.enums.ddp import DolbyDigitalPlusChannels
 from deezy.exceptions import XMLFileNotFoundError
 
 
+# the base template never changes, parse it once and hand each generator a copy
+_XML_BASE_DDP = xmltodict.parse(xml_audio_base_ddp)
+
+
+def _copy_xml_tree(node):
+    """Copies a parsed XML tree, which only holds dicts, lists and strings.
+
+    Args:
+        node: Parsed XML node
+
+    Returns:
+        A copy of the node with new dicts/lists (strings are shared)
+    """
+    if isinstance(node, dict):
+        return {key: _copy_xml_tree(value) for key, value in node.items()}
+    elif isinstance(node, list):
+        return [_copy_xml_tree(value) for value in node]
+    return node
+
+
 class DeeXMLGenerator:
     """Handles the parsing/creation of XML file for DEE encoding"""
 
@@ -40,8 +60,8 @@ class DeeXMLGenerator:
         # bitrate
         self.bitrate = bitrate
 
-        # Parse base template
-        self.xml_base = xmltodict.parse(xml_audio_base_ddp)
+        # copy of the parsed base template
+        self.xml_base = _copy_xml_tree(_XML_BASE_DDP)
 
         # xml wav filename/path
         self.xml_base["job_config"]["input"]["audio"]["wav"][
@@ -254,7 +274,7 @@ class DeeXMLGenerator:
 
     @staticmethod
     def _save_xml(output_dir: Path, output_file_name: Path, xml_base: dict):
-        """Creates/Deletes old XML files for use with DEE
+        """Creates/Overwrites XML files for use with DEE
 
         Args:
             output_dir (Path): Full output directory
@@ -269,13 +289,10 @@ class DeeXMLGenerator:
             ".xml"
         )
 
-        # delete xml output template if one already exists
-        if updated_template_file.exists():
-            updated_template_file.unlink()
-
-        # write new xml template for dee
-        with open(updated_template_file, "w", encoding="utf-8") as xml_out:
-            xml_out.write(xmltodict.unparse(xml_base, pretty=True, indent="  "))
+        # write new xml template for dee in one call (replaces any existing template)
+        updated_template_file.write_text(
+            xmltodict.unparse(xml_base, pretty=True, indent="  "), encoding="utf-8"
+        )
 
         # check to ensure template file was created
         if updated_template_file.exists():
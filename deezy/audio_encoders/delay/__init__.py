@@ -3,6 +3,12 @@ from datetime import timedelta
 from deezy.exceptions import InvalidDelayError
 from deezy.enums.shared import DeeDelay, DeeDelayModes
 
+# compiled once and shared by every delay conversion
+_NUMBER_RE = re.compile(r"\d+\.?\d*")
+_INTEGER_RE = re.compile(r"\d+")
+_INVALID_CHARS_RE = re.compile(r"[^\-\sms\d]")
+_WHITESPACE_RE = re.compile(r"\s")
+
 
 class DelayGenerator:
     def get_dee_delay(self, delay: str, compensate: bool = True):
@@ -36,7 +42,7 @@ class DelayGenerator:
         get_delay = self._convert_delay_ms(delay)
 
         # get only numbers from delay
-        s_delay = re.search(r"\d+\.?\d*", get_delay)
+        s_delay = _NUMBER_RE.search(get_delay)
 
         # if numbers was detected
         if s_delay:
@@ -91,7 +97,7 @@ class DelayGenerator:
 
         # check if input is in milliseconds
         if "ms" in lowered_input:
-            ms_delay = re.search(r"\d+", lowered_input)
+            ms_delay = _INTEGER_RE.search(lowered_input)
             if ms_delay:
                 ms_delay = float(ms_delay.group())
             else:
@@ -102,7 +108,7 @@ class DelayGenerator:
 
         # check if input is in seconds
         elif "s" in lowered_input:
-            s_delay = re.search(r"\d+\.?\d*", lowered_input)
+            s_delay = _NUMBER_RE.search(lowered_input)
             if s_delay:
                 s_delay = float(s_delay.group())
             else:
@@ -131,11 +137,11 @@ class DelayGenerator:
         Raises:
             InvalidDelayError: If the delay string contains any invalid characters.
         """
-        invalid_chars = re.findall(r"[^\-\sms\d]", delay.lower())
+        invalid_chars = _INVALID_CHARS_RE.findall(delay.lower())
         if invalid_chars:
             raise InvalidDelayError(
                 f"Invalid characters detected: {', '.join(invalid_chars)}\n"
                 "Delay input must be in the format of -10ms/10ms or -10s/10s"
             )
-        if re.search(r"\s", delay):
+        if _WHITESPACE_RE.search(delay):
             raise InvalidDelayError("Delay input cannot contain whitespace characters.")
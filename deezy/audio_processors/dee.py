@@ -1,45 +1,72 @@
+from collections import deque
 from subprocess import Popen, PIPE, STDOUT
-from deezy.utils.utils import PrintSameLine
+from deezy.utils.utils import OUTPUT_TAIL_LINES, PIPE_BUFFER_SIZE, PrintSameLine
 from deezy.enums.shared import ProgressMode
 import re
 
 
+# DEE verbosity level for each progress mode
+_DEE_VERBOSITY = {
+    ProgressMode.STANDARD: "info",
+    ProgressMode.DEBUG: "debug",
+    ProgressMode.SILENT: "error",
+}
+
+# DEE stage progress percentage
+_DEE_PROGRESS_RE = re.compile(r"Stage\sprogress:\s(.+),")
+
+
 class ProcessDEE:
     def process_job(self, cmd: list, progress_mode: ProgressMode):
         """Processes file with DEE while generating progress depending on progress_mode.
 
         Args:
             cmd (list): Base DEE cmd list
-            progress_mode (ProgressMode): Options are ProgressMode.STANDARD or ProgressMode.DEBUG
+            progress_mode (ProgressMode): Options are ProgressMode.STANDARD, ProgressMode.DEBUG
+                or ProgressMode.SILENT
         """
 
-        # inject verbosity level into cmd list depending on progress_mode
-        inject = cmd.index("--verbose") + 1
-        if progress_mode == ProgressMode.STANDARD:
-            cmd.insert(inject, "info")
-        elif progress_mode == ProgressMode.DEBUG:
-            cmd.insert(inject, "debug")
+        # add verbosity level to the cmd depending on progress_mode
+        cmd = [cmd[0], "--verbose", _DEE_VERBOSITY[progress_mode], *cmd[1:]]
 
         # variable to update to print step 3
         last_number = 0
 
-        with Popen(cmd, stdout=PIPE, stderr=STDOUT, universal_newlines=True) as proc:
-            if progress_mode == ProgressMode.STANDARD:
+        with Popen(
+            cmd,
+            stdout=PIPE,
+            stderr=STDOUT,
+            universal_newlines=True,
+            bufsize=PIPE_BUFFER_SIZE,
+            encoding="utf-8",
+            errors="replace",
+        ) as proc:
+            show_progress = progress_mode == ProgressMode.STANDARD
+            if show_progress:
                 print("---- Step 2 of 3 ---- [DEE measure]")
 
             # initiate print on same line
             print_same_line = PrintSameLine()
 
+            # output hidden by progress mode, only the tail is needed on failure
+            output_tail = deque(maxlen=OUTPUT_TAIL_LINES)
+
             for line in proc.stdout:
                 # check for all dee errors
                 if "ERROR " in line:
                     raise ValueError(f"There was a DEE error: {line}")
 
+                # most DEE output isn't progress, so a plain substring check
+                # keeps those lines out of the regex entirely
+                progress_match = None
+                if "Stage progress" in line:
+                    progress_match = _DEE_PROGRESS_RE.search(line)
+
                 # If progress mode is quiet let's clean up progress output
-                if progress_mode == ProgressMode.STANDARD:
-                    # We need to wait for size= to prevent any errors
-                    if "Stage progress" in line:
-                        progress = self._filter_dee_progress(line)
+                if show_progress:
+                    # We need to wait for stage progress to prevent any errors
+                    if progress_match:
+                        progress = float(progress_match.group(1))
 
                         # If last number is greater than progress, this means we have already hit 100% on step 2
                         # So we can print the start of step 3
@@ -54,25 +81,19 @@ class ProcessDEE:
 
                         # update last number
                         last_number = progress
-                    pass
-                else:
+                    else:
+                        output_tail.append(line.strip())
+                # raw DEE output is only printed in debug mode
+                elif progress_mode == ProgressMode.DEBUG:
                     print(line.strip())
+                else:
+                    output_tail.append(line.strip())
 
         if proc.returncode != 0:
-            raise ValueError("There was an DEE error. Please re-run in debug mode.")
+            # only append the captured output when there is some
+            error_msg = "There was an DEE error. Please re-run in debug mode."
+            if output_tail:
+                error_msg += "\n" + "\n".join(output_tail)
+            raise ValueError(error_msg)
         else:
             return True
-
-    @staticmethod
-    def _filter_dee_progress(line: str):
-        """Filters dee's total progress output
-
-        Args:
-            line (str): Dee's cli output
-
-        Returns:
-            float: Progress output
-        """
-        get_progress = re.search(r"Stage\sprogress:\s(.+),", line)
-        if get_progress:
-            return float(get_progress.group(1))
@@ -1,10 +1,25 @@
+from collections import deque
 from typing import Union
 from subprocess import Popen, PIPE, STDOUT
 import re
-from deezy.utils.utils import PrintSameLine
+from deezy.utils.utils import OUTPUT_TAIL_LINES, PIPE_BUFFER_SIZE, PrintSameLine
 from deezy.enums.shared import ProgressMode
 
 
+# FFMPEG -stats line, capturing the (possibly negative) elapsed HH:MM:SS
+_FFMPEG_PROGRESS_RE = re.compile(
+    r"size=.*?time=(?P<negative>-)?(?P<hours>\d+):(?P<minutes>\d\d):(?P<seconds>\d\d)"
+)
+
+
+# FFMPEG log level for each progress mode (errors are kept so a failure can report them)
+_FFMPEG_VERBOSITY = {
+    ProgressMode.STANDARD: "error",
+    ProgressMode.DEBUG: "info",
+    ProgressMode.SILENT: "error",
+}
+
+
 # TODO Modify this to work with more than just DEE, for now hard coded to DEE's uses
 class ProcessFFMPEG:
     def process_job(
@@ -18,56 +33,81 @@ class ProcessFFMPEG:
 
         Args:
             cmd (list): Base FFMPEG command list
-            progress_mode (ProgressMode): Options are ProgressMode.STANDARD or ProgressMode.DEBUG
+            progress_mode (ProgressMode): Options are ProgressMode.STANDARD, ProgressMode.DEBUG
+                or ProgressMode.SILENT
             steps (bool): True or False, to disable updating encode steps
             duration (Union[float, None]): Can be None or duration in milliseconds
             If set to None the generic FFMPEG output will be displayed
             If duration is passed then we can calculate the total progress for FFMPEG
         """
-        # inject verbosity level into cmd list depending on progress_mode
-        inject = cmd.index("-v") + 1
-        if progress_mode == ProgressMode.STANDARD:
-            cmd.insert(inject, "quiet")
-        elif progress_mode == ProgressMode.DEBUG:
-            cmd.insert(inject, "info")
-
-        with Popen(cmd, stdout=PIPE, stderr=STDOUT, universal_newlines=True) as proc:
+        # add verbosity level (global option) to the cmd depending on progress_mode
+        cmd = [cmd[0], "-v", _FFMPEG_VERBOSITY[progress_mode], *cmd[1:]]
+
+        with Popen(
+            cmd,
+            stdout=PIPE,
+            stderr=STDOUT,
+            universal_newlines=True,
+            bufsize=PIPE_BUFFER_SIZE,
+            encoding="utf-8",
+            errors="replace",
+        ) as proc:
             if progress_mode == ProgressMode.STANDARD and steps:
                 print("---- Step 1 of 3 ---- [FFMPEG]")
 
             # initiate print on same line
             print_same_line = PrintSameLine()
 
+            # Some audio formats actually do not have a "duration" in their raw containers,
+            # if this is the case we will default ffmpeg to it's generic output string.
+            show_progress = bool(duration) and progress_mode == ProgressMode.STANDARD
+
+            # output hidden by progress mode, only the tail is needed on failure
+            output_tail = deque(maxlen=OUTPUT_TAIL_LINES)
+
+            # keep reading to EOF after 100% so FFMPEG can finish writing the file
+            finished = False
+
             for line in proc.stdout:
-                # Some audio formats actually do not have a "duration" in their raw containers,
-                # if this is the case we will default ffmpeg to it's generic output string.
-                if duration and progress_mode == ProgressMode.STANDARD:
+                if show_progress:
                     # we need to wait for size= to prevent any errors
-                    if "size=" in line:
-                        percentage = self._convert_ffmpeg_to_percent(line, duration)
+                    progress = _FFMPEG_PROGRESS_RE.search(line)
+                    if progress:
+                        percentage = self._convert_ffmpeg_to_percent(progress, duration)
 
-                        # update progress but break when 100% is met to prevent printing 100% multiple times
+                        # update progress but only print 100% once
                         if percentage != "100.0%":
                             print_same_line.print_msg(percentage)
-                        else:
+                        elif not finished:
                             print_same_line.print_msg("100.0%\n")
-                            break
+                            finished = True
+                    else:
+                        output_tail.append(line.strip())
+                # silent mode keeps everything out of the console, -stats lines are
+                # dropped so the tail only holds diagnostics
+                elif progress_mode == ProgressMode.SILENT:
+                    if not _FFMPEG_PROGRESS_RE.search(line):
+                        output_tail.append(line.strip())
                 else:
                     print(line.strip())
 
         if proc.returncode != 0:
-            raise ValueError("There was an FFMPEG error. Please re-run in debug mode.")
+            # only append the captured output when there is some
+            error_msg = "There was an FFMPEG error. Please re-run in debug mode."
+            if output_tail:
+                error_msg += "\n" + "\n".join(output_tail)
+            raise ValueError(error_msg)
         else:
             return True
 
     @staticmethod
-    def _convert_ffmpeg_to_percent(line: str, duration: float):
+    def _convert_ffmpeg_to_percent(progress: re.Match, duration: float):
         """
-        Detect the format of 'HH:MM:SS' that FFMPEG provides, and convert it to milliseconds.
+        Convert the 'HH:MM:SS' time that FFMPEG provides to milliseconds.
         This will allow us to generate an overall percentage based on the audio track's duration from the input.
 
         Args:
-            line (str): FFMPEG generic output string
+            progress (re.Match): Match of FFMPEG's -stats line
             duration (float): Source's audio track duration (ms)
 
         Returns:
@@ -75,18 +115,14 @@ class ProcessFFMPEG:
         """
         # sometimes FFMPEG can start at a negative (-) value, this will prevent
         # progress from breaking
-        if "time=-" in line:
+        if progress.group("negative"):
             return "0%"
 
         # once the time is not a negative value actual calculate progress
-        else:
-            time = re.search(r"(\d\d):(\d\d):(\d\d)", line.strip())
-            if time:
-                total_ms = (
-                    int(time.group(1)) * 3600000
-                    + int(time.group(2)) * 60000
-                    + int(time.group(3)) * 1000
-                )
-                progress = float(total_ms) / float(duration)
-                percent = "{:.1%}".format(min(1.0, progress))
-                return percent
+        total_ms = (
+            int(progress.group("hours")) * 3600000
+            + int(progress.group("minutes")) * 60000
+            + int(progress.group("seconds")) * 1000
+        )
+        percent = "{:.1%}".format(min(1.0, float(total_ms) / float(duration)))
+        return percent
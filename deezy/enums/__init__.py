@@ -1,7 +1,10 @@
 from argparse import ArgumentTypeError
 from enum import Enum
+from functools import lru_cache
 
 
+# converters and choice strings only depend on the enum class, build each once
+@lru_cache(maxsize=None)
 def case_insensitive_enum(enum_class):
     """Return a converter that takes a string and returns the corresponding
     enumeration value, regardless of case.
@@ -30,6 +33,7 @@ def case_insensitive_enum(enum_class):
     return converter
 
 
+@lru_cache(maxsize=None)
 def enum_choices(enum_class: Enum) -> str:
     """
     Returns a string representation of all possible choices in the given enumeration class.
@@ -2,7 +2,10 @@ from deezy.track_info.audio_track_info import AudioTrackInfo
 from deezy.exceptions import MediaInfoError
 from pymediainfo import MediaInfo
 from pathlib import Path
-from re import search
+import re
+
+# compiled once and reused for every parsed track
+_DIGITS_RE = re.compile(r"\d+")
 
 
 class AutoFileName:
@@ -246,7 +249,7 @@ class MediainfoParser:
         """
         track = mi_object.audio_tracks[track_index]
         base_channels = track.channel_s
-        check_other = search(r"\d+", str(track.other_channel_s[0]))
+        check_other = _DIGITS_RE.search(str(track.other_channel_s[0]))
         check_other_2 = str(track.channel_s__original)
 
         # Create a list of values to find the maximum
@@ -1,5 +1,6 @@
 from pathlib import Path
 import glob
+import os
 
 
 class FileParser:
@@ -19,26 +20,17 @@ class FileParser:
         """
         input_s = []
         for arg_input in args_list:
-            # non recursive
+            # wildcard search, a single glob pass covers both "*" and recursive "**"
+            # (recursive=True only changes how "**" is expanded)
             if "*" in arg_input:
-                input_s.extend(
-                    Path(p) for p in glob.glob(arg_input) if Path(p).is_file()
-                )
-
-            # recursive search
-            elif "**" in arg_input:
                 input_s.extend(
                     Path(p)
                     for p in glob.glob(arg_input, recursive=True)
-                    if Path(p).is_file()
+                    if os.path.isfile(p)
                 )
 
             # single file path
-            elif (
-                Path(arg_input).exists()
-                and Path(arg_input).is_file()
-                and arg_input.strip() != ""
-            ):
+            elif arg_input.strip() != "" and os.path.isfile(arg_input):
                 input_s.append(Path(arg_input))
             else:
                 raise FileNotFoundError(f"{arg_input} is not a valid input path.")
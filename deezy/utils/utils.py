@@ -1,6 +1,13 @@
 import sys
 from pathlib import Path
 
+# read child process output through a large buffer so progress heavy jobs
+# don't cost a syscall per line
+PIPE_BUFFER_SIZE = 65536
+
+# number of suppressed child process output lines kept to explain a failed job
+OUTPUT_TAIL_LINES = 20
+
 
 class PrintSameLine:
     """Class to correctly print on same line"""
@@ -9,8 +16,12 @@ class PrintSameLine:
         self.last_message = ""
 
     def print_msg(self, msg: str):
-        print(" " * len(self.last_message), end="\r", flush=True)
-        print(msg, end="\r", flush=True)
+        # nothing to redraw if the message hasn't changed
+        if msg == self.last_message:
+            return
+
+        # clear the last message and write the new one in a single flushed write
+        print(f"{' ' * len(self.last_message)}\r{msg}", end="\r", flush=True)
         self.last_message = msg
 
 